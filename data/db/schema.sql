@@ -8,3 +8,5 @@ CREATE TABLE IF NOT EXISTS job (
     slurm_id TEXT,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE INDEX IF NOT EXISTS job_pending ON job (job_id) WHERE valid = 1 AND staged = 0 AND submitted = 0;
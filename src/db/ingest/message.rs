@@ -1,23 +1,29 @@
 use anyhow::Result;
-use log::info;
+use log::{info, warn};
 use rusqlite::Connection;
 
 use crate::request::message::AllasMessage;
 
-/// Load an AllasMessage into a database
+/// Load a batch of AllasMessages into a database
 ///
-/// The AllasMessage is stored in a JSON column and the schema will automatically extract the
-/// INTERVENE ID and add an insertion timestamp
-pub fn ingest_message(conn: &Connection, message: &AllasMessage) -> Result<()> {
-    info!("Adding {} to db", &message.key);
-    let json = &message.content;
-    let valid = &message.valid;
+/// Each AllasMessage is stored in a JSON column and the schema will automatically extract the
+/// INTERVENE ID and add an insertion timestamp. The insert statement is prepared once and reused
+/// for every message in the batch.
+///
+/// INTERVENE IDs must be unique. The uniqueness check and the insert are a single statement, so
+/// a message that's already in the database is skipped instead of checked for separately.
+pub fn ingest_messages(conn: &Connection, messages: &[AllasMessage]) -> Result<()> {
+    let mut stmt = conn.prepare("INSERT OR IGNORE INTO job (manifest, valid) VALUES (?1, ?2)")
+        .expect("Prepared insert");
 
-    conn.execute(
-        "INSERT INTO job (manifest, valid) VALUES (?1, ?2)",
-        (json, valid),
-    )
-        .expect("Error inserting job");
+    for message in messages {
+        info!("Adding {} to db", &message.key);
+        let inserted = stmt.execute((&message.content, &message.valid))
+            .expect("Error inserting job");
+        if inserted == 0 {
+            warn!("{} is already in the db, skipping", &message.key);
+        }
+    }
 
     Ok(())
 }
@@ -1,24 +1,25 @@
 use log::info;
 use rusqlite::Connection;
-use serde_json::Result as JsonResult;
+use rusqlite::types::Type;
 
 use crate::slurm::job_request::JobRequest;
 
 /// Fetch and deserialise valid unsubmitted jobs from the database
+///
+/// Each manifest is deserialised straight from the row it's stored in, without collecting an
+/// intermediate copy of every JSON string first
 pub fn get_valid_jobs(conn: &Connection, dry_run: bool) -> Option<Vec<JobRequest>> {
     let mut stmt = conn.prepare("SELECT manifest FROM job WHERE valid == 1 AND staged == 0 AND submitted == 0").expect("");
-    let rows = stmt.query_map([], |row| row.get(0)).expect("");
-
-    let mut json: Vec<String> = Vec::new();
-    for row in rows {
-        let json_string: String = row.expect("");
+    let rows = stmt.query_map([], |row| {
+        let json_string: &str = row.get_ref(0)?.as_str()?;
         info!("Loading valid job from db: {} ...", &json_string[..50]);
-        json.push(json_string);
-    }
+        deserialise(json_string)
+    }).expect("");
+
+    let jobs: Vec<JobRequest> = rows.collect::<rusqlite::Result<_>>().expect("Deserialised JSON");
 
     release_or_rollback(&conn, dry_run);
 
-    let jobs = deserialise(json).expect("Deserialised JSON");
     match jobs.is_empty() {
         true => { None }
         false => { Some(jobs) }
@@ -26,13 +27,9 @@ pub fn get_valid_jobs(conn: &Connection, dry_run: bool) -> Option<Vec<JobRequest
 }
 
 /// Deserialise validated JSON into a [JobRequest]
-fn deserialise(json_strings: Vec<String>) -> JsonResult<Vec<JobRequest>> {
-    let mut jobs: Vec<JobRequest> = Vec::new();
-    for string in json_strings {
-        let job: JobRequest = serde_json::from_str(&string)?;
-        jobs.push(job);
-    }
-    Ok(jobs)
+fn deserialise(json_string: &str) -> rusqlite::Result<JobRequest> {
+    serde_json::from_str(json_string)
+        .map_err(|err| rusqlite::Error::FromSqlConversionFailure(0, Type::Text, Box::new(err)))
 }
 
 /// Release (commit transaction) or rollback (abort transaction) messages to the database
@@ -11,10 +11,21 @@ pub enum JobState {
 impl JobState {
     /// db columns are all lower case, enum used in sql statement
     /// TODO: migrate to a single enum column called "state"
-    pub fn to_string(&self) -> &str {
+    pub fn to_string(&self) -> &'static str {
         match self {
             JobState::Staged => "staged",
             JobState::Submitted => "submitted"
         }
     }
+
+    /// Static SQL statement that sets this state, so no statement text is formatted per update
+    ///
+    /// The INTERVENE ID is always the first parameter. Submitted jobs also record their SLURM job
+    /// ID as the second parameter.
+    pub fn update_statement(&self) -> &'static str {
+        match self {
+            JobState::Staged => "UPDATE job SET staged = 1 WHERE intervene_id = ?1",
+            JobState::Submitted => "UPDATE job SET submitted = 1, slurm_id = ?2 WHERE intervene_id = ?1"
+        }
+    }
 }
\ No newline at end of file
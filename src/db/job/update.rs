@@ -16,17 +16,19 @@ impl JobRequest {
     pub fn submit(&self, conn: &Connection, job: JobPath) {
         let job_id = self.run_sbatch(job);
         info!("SLURM job id: {job_id}");
-        let state = JobState::Submitted;
-        self.update(conn, state);
-        self.update_slurm(conn, job_id).expect("update OK");
+        self.update_submitted(conn, job_id).expect("update OK");
     }
 
-    fn update_slurm(&self, conn: &Connection, slurm_id: String) -> rusqlite::Result<()> {
+    /// Set the submitted state and SLURM job ID together, so a submission is one row update
+    fn update_submitted(&self, conn: &Connection, slurm_id: String) -> rusqlite::Result<()> {
         let id = &self.pipeline_param.id.to_string();
-        info!("Updating {id} with slurm ID {slurm_id}");
+        let state = JobState::Submitted;
+        let col = state.to_string();
+        info!("Updating {id} with state {col} and slurm ID {slurm_id}");
+
         conn
-            .execute("UPDATE job SET slurm_id = ? WHERE intervene_id = ?",
-            &[&slurm_id, &id])
+            .prepare_cached(state.update_statement())?
+            .execute(&[id.as_str(), slurm_id.as_str()])
             .expect("Update");
 
         Ok(())
@@ -36,12 +38,12 @@ impl JobRequest {
         let id = &self.pipeline_param.id.to_string();
         let col = state.to_string();
         info!("Updating {id} with state {col}");
-        let stmt = format!("UPDATE job SET {col} = 1 WHERE intervene_id = (?1)");
 
-        conn.execute(
-            &stmt,
-            &[(id.as_str())],
-        ).expect("Update job status to {col}");
+        conn
+            .prepare_cached(state.update_statement())
+            .expect("Prepared update")
+            .execute(&[(id.as_str())])
+            .expect("Update job status to {col}");
     }
 
     fn run_sbatch(&self, job_path: JobPath) -> String {
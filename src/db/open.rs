@@ -7,9 +7,14 @@ pub fn open_db(wd: &WorkingDirectory) -> rusqlite::Result<rusqlite::Connection>
     if !path.exists() { info!("Creating new database {}", path.display()) }
     let conn = rusqlite::Connection::open(&path)?;
 
+    // write-ahead logging: commits append to the log instead of rewriting the database file
+    let journal_mode: String = conn.pragma_update_and_check(None, "journal_mode", "WAL", |row| row.get(0))?;
+    info!("Database journal mode: {journal_mode}");
+    conn.pragma_update(None, "synchronous", "NORMAL")?;
+
     /// A SQLite database schema that stores job status
     static SCHEMA: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/db/schema.sql"));
-    conn.execute(SCHEMA, [], )?;
+    conn.execute_batch(SCHEMA)?;
 
     info!("Creating dry run save point");
     conn.execute("SAVEPOINT dry_run", []).expect("Start transaction");
@@ -18,7 +18,7 @@ use clap::Parser;
 use log::info;
 use rusqlite::Connection;
 
-use crate::db::ingest::message::ingest_message;
+use crate::db::ingest::message::ingest_messages;
 use crate::db::job::load::get_valid_jobs;
 use crate::slurm::job_request::JobRequest;
 
@@ -81,14 +81,12 @@ async fn main() {
     let messages = request::message::fetch_all(&s3_client, &schema).await;
 
     if let Some(messages) = messages {
-        for message in messages {
-            let _ = ingest_message(&conn, &message);
+        let _ = ingest_messages(&conn, &messages);
 
-            if !args.dry_run {
-                message.delete(&s3_client).await;
-            } else {
-                info!("--dry-run set, not deleting message in queue");
-            }
+        if !args.dry_run {
+            request::message::delete_all(&s3_client, messages).await;
+        } else {
+            info!("--dry-run set, not deleting messages in queue");
         }
     } else {
         info!("No new jobs in queue");
@@ -97,8 +95,9 @@ async fn main() {
     let jobs: Option<Vec<JobRequest>> = get_valid_jobs(&conn, args.dry_run);
 
     if let Some(jobs) = jobs {
+        let templates = slurm::job::load_templates();
         for job in jobs {
-            let job_path = job.create(&wd, &args.globus_jar_path);
+            let job_path = job.create(&wd, &args.globus_jar_path, &templates);
             if !args.dry_run {
                 job.stage(&conn);
                 job.submit(&conn, job_path);
@@ -63,10 +63,21 @@ pub async fn fetch_all(s3_client: &rusoto_s3::S3Client, schema: &JSONSchema) ->
         None => { return None; }
         Some(objects) => {
             info!("Found new messages in queue");
-            for object in objects {
-                let key = object.key.unwrap();
-                info!("Object key: {}", key);
-                let content = read_job(&s3_client, bucket, &key).await;
+            // start every download before waiting on any of them, then collect in listing order
+            let reads: Vec<_> = objects.into_iter()
+                .map(|object| {
+                    let key = object.key.unwrap();
+                    info!("Object key: {}", key);
+                    let s3_client = s3_client.clone();
+                    tokio::spawn(async move {
+                        let content = read_job(&s3_client, bucket, &key).await;
+                        (key, content)
+                    })
+                })
+                .collect();
+
+            for read in reads {
+                let (key, content) = read.await.expect("Read job");
                 // info!("Object content: {content}");
                 jobs.push(AllasMessage::new(content,
                                             bucket.to_string(),
@@ -79,6 +90,24 @@ pub async fn fetch_all(s3_client: &rusoto_s3::S3Client, schema: &JSONSchema) ->
     Some(jobs)
 }
 
+/// Delete a batch of messages from the work queue
+///
+/// Each deletion is an independent request, so they're sent concurrently and the batch takes
+/// about as long as the slowest deletion
+pub async fn delete_all(s3_client: &rusoto_s3::S3Client, messages: Vec<AllasMessage>) {
+    let mut deletions = tokio::task::JoinSet::new();
+    for message in messages {
+        let s3_client = s3_client.clone();
+        deletions.spawn(async move { message.delete(&s3_client).await });
+    }
+
+    while let Some(result) = deletions.join_next().await {
+        if let Err(err) = result {
+            warn!("Error joining delete task: {}", err);
+        }
+    }
+}
+
 /// Stream job content (JSON) from a bucket object into a String
 async fn read_job(s3_client: &rusoto_s3::S3Client, bucket: &str, key: &String) -> String {
     let get_object_request = rusoto_s3::GetObjectRequest {
@@ -100,26 +129,30 @@ async fn read_job(s3_client: &rusoto_s3::S3Client, bucket: &str, key: &String) -
             .expect("Failed to read file");
     }
 
-    String::from_utf8_lossy(&body).to_string()
+    // take ownership of valid UTF-8 without copying, only fall back to a lossy copy if needed
+    String::from_utf8(body)
+        .unwrap_or_else(|err| String::from_utf8_lossy(err.as_bytes()).into_owned())
 }
 
 /// Validate job content with a JSON schema
+///
+/// Most messages are valid, so check with [JSONSchema::is_valid] first. It stops at the first
+/// failure and doesn't build error values. Detailed errors are only collected for invalid messages.
 fn validate_message(json_string: &Value, schema: &JSONSchema) -> Result<(), io::Error> {
     info!("Validating message against JSON schema");
-    match schema.validate(json_string) {
-        Ok(_) => {
-            info!("Message is valid");
-            Ok(())
-        },
-        Err(errors) => {
-            for error in errors {
-                warn!("Validation error: {}", error);
-                warn!("Instance path: {}", error.instance_path);
-            }
-            let err = io::Error::new(ErrorKind::Other, "JSON validation error");
-            Err(err)
+    if schema.is_valid(json_string) {
+        info!("Message is valid");
+        return Ok(());
+    }
+
+    if let Err(errors) = schema.validate(json_string) {
+        for error in errors {
+            warn!("Validation error: {}", error);
+            warn!("Instance path: {}", error.instance_path);
         }
     }
+    let err = io::Error::new(ErrorKind::Other, "JSON validation error");
+    Err(err)
 }
 
 impl AllasMessage {
@@ -138,8 +171,8 @@ impl AllasMessage {
     /// Delete messages in the work queue
     ///
     /// It's important to delete after the job has been ingested into the database. Jobs in the
-    /// database must have unique identifiers. Violating this constraint will currently cause a
-    /// panic.
+    /// database must have unique identifiers. Messages with an identifier that's already in the
+    /// database are skipped during ingest.
     pub async fn delete(&self, s3_client: &rusoto_s3::S3Client) {
         let bucket = self.bucket.to_string();
         let key = self.key.to_string();
@@ -1,6 +1,6 @@
 use std::{fs, io};
 use std::fs::{File, OpenOptions};
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
 
 use chrono::Utc;
@@ -23,7 +23,7 @@ pub struct JobPath {
 }
 
 impl JobRequest {
-    pub fn create(&self, wd: &WorkingDirectory, globus_path: &PathBuf) -> JobPath {
+    pub fn create(&self, wd: &WorkingDirectory, globus_path: &PathBuf, templates: &TinyTemplate) -> JobPath {
         let instance_wd = WorkingDirectory { path: wd.path.join(&&self.pipeline_param.id) };
         info!("Creating job {} in working directory {}", &&self.pipeline_param.id, &instance_wd.path.display());
 
@@ -33,10 +33,10 @@ impl JobRequest {
         }
         fs::create_dir(&instance_wd.path).expect("Create working directory");
 
-        let header: Header = render_header(&&self.pipeline_param);
-        let callback: Callback = render_callback(&&self.pipeline_param);
+        let header: Header = render_header(templates, &&self.pipeline_param);
+        let callback: Callback = render_callback(templates, &&self.pipeline_param);
         let vars: EnvVars = read_environment_variables();
-        let workflow: Workflow = render_nxf(&globus_path, &&self.pipeline_param,  &wd.path);
+        let workflow: Workflow = render_nxf(templates, &globus_path, &&self.pipeline_param,  &wd.path);
         let job = JobTemplate { header, callback, vars, workflow };
 
         let path = &instance_wd.path.join("job.sh");
@@ -68,10 +68,10 @@ impl JobTemplate {
 
         // order is important when writing the file
         let contents = [
-            self.header.content,
-            self.callback.content,
+            self.header.content.as_str(),
+            self.callback.content.as_str(),
             self.vars.content,
-            self.workflow.content,
+            self.workflow.content.as_str(),
         ];
 
         for content in contents.iter() {
@@ -113,8 +113,9 @@ struct Header {
 /// Rendered environment variables section
 ///
 /// Environment variables are used to control nextflow execution and the globus transfer.
+/// The section is static, so it borrows the included template instead of copying it.
 struct EnvVars {
-    content: String,
+    content: &'static str,
 }
 
 /// Rendered workflow commands
@@ -128,10 +129,13 @@ struct Workflow {
 }
 
 /// Rendering context for header
+///
+/// Rendering contexts borrow from the job request instead of cloning it, they're only alive
+/// while a template is rendered
 #[derive(Serialize)]
-struct HeaderContext {
-    name: String,
-    job_time: String,
+struct HeaderContext<'a> {
+    name: &'a str,
+    job_time: &'a str,
     time_now: String,
 }
 
@@ -145,36 +149,38 @@ struct EnvVarContext {
 
 /// Rendering context for workflow
 #[derive(Serialize)]
-struct NextflowContext {
-    name: String,
-    work_dir: String,
-    pgsc_calc_dir: String,
-    globus_path: String,
-    globus_parent_path: String
+struct NextflowContext<'a> {
+    name: &'a str,
+    work_dir: &'a str,
+    pgsc_calc_dir: &'a str,
+    globus_path: &'a str,
+    globus_parent_path: &'a str
 }
 
 /// Rendering context for callback
 #[derive(Serialize)]
-struct CallbackContext {
-    name: String,
+struct CallbackContext<'a> {
+    name: &'a str,
 }
 
 /// Write nextflow parameters to working directory
 fn write_config(nxf_params: &NxfParamsFile, wd: &WorkingDirectory) {
-    let params_file: String = serde_json::to_string(nxf_params).expect("Deserialised");
     let out_path = wd.path.join("params.json");
     info!("Writing params to {}", out_path.display());
-    fs::write(out_path, params_file).expect("Can't write config");
+    let mut writer = BufWriter::new(File::create(out_path).expect("Can't write config"));
+    serde_json::to_writer(&mut writer, nxf_params).expect("Deserialised");
+    writer.flush().expect("Can't write config");
 }
 
 
 /// Extract the target_genomes object to a JSON file (`pgsc_calc --input` parameter)
 fn write_samplesheet(param: &PipelineParam, wd: &WorkingDirectory) {
     let genomes: &Vec<TargetGenome> = &param.target_genomes;
-    let samplesheet: String = serde_json::to_string(genomes).expect("Deserialised");
     let out_path = wd.path.join("input.json");
     info!("Writing samplesheet to {}", out_path.display());
-    fs::write(out_path, samplesheet).expect("Can't write file");
+    let mut writer = BufWriter::new(File::create(out_path).expect("Can't write file"));
+    serde_json::to_writer(&mut writer, genomes).expect("Deserialised");
+    writer.flush().expect("Can't write file");
 }
 
 /// Write static Allas configuration to the working directory
@@ -185,17 +191,31 @@ fn write_allas(wd: &WorkingDirectory) {
     fs::write(out_path, allas.content).expect("Can't write file");
 }
 
-/// Render the SBATCH header using TinyTemplate
-fn render_header(param: &PipelineParam) -> Header {
+/// Parse and compile the included job templates
+///
+/// Templates are static, so they're compiled once and shared by every job rendered in a run
+pub fn load_templates() -> TinyTemplate<'static> {
     /// included header template
     static HEADER: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/header.txt"));
+    /// included callback template
+    static CALLBACK: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/callback.txt"));
+    /// included workflow template
+    static NXF: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/nxf.txt"));
+
+    info!("Compiling job templates");
     let mut tt = TinyTemplate::new();
     tt.add_template("header", HEADER).expect("Template");
+    tt.add_template("callback", CALLBACK).expect("Template");
+    tt.add_template("nxf", NXF).expect("Template");
+    tt
+}
 
+/// Render the SBATCH header using TinyTemplate
+fn render_header(tt: &TinyTemplate, param: &PipelineParam) -> Header {
     let context = HeaderContext {
-        name: param.id.to_string(),
+        name: &param.id,
         // (todo: run job for 1 hour)
-        job_time: "01:00:00".to_string(),
+        job_time: "01:00:00",
         time_now: Utc::now().to_string(),
     };
 
@@ -206,50 +226,42 @@ fn render_header(param: &PipelineParam) -> Header {
 fn read_environment_variables() -> EnvVars {
     /// included environment variables template, everything is static
     static ENV_VARS: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/env_vars.txt"));
-    EnvVars { content: ENV_VARS.to_string() }
+    EnvVars { content: ENV_VARS }
 }
 
 /// Render the workflow commands using TinyTemplate
-fn render_nxf(globus_path: &PathBuf, param: &PipelineParam, work_dir: &Path) -> Workflow {
-    /// included workflow template
-    static NXF: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/nxf.txt"));
-    let mut tt = TinyTemplate::new();
-    tt.add_template("nxf", NXF).expect("Template");
-    let name: &String = &param.id;
-    let wd = work_dir.to_str().expect("path").to_string();
+fn render_nxf(tt: &TinyTemplate, globus_path: &PathBuf, param: &PipelineParam, work_dir: &Path) -> Workflow {
+    let name: &str = &param.id;
+    let wd = work_dir.to_str().expect("path");
     // todo: make dynamic based on deployment namespace
     /// installation directory of pgsc_calc (TODO: make this a parameter)
     static PGSC_CALC_DIR: &str = "/scratch/project_2004504/pgsc_calc/";
-    let context = NextflowContext { name: name.clone(),
+    let context = NextflowContext { name,
         work_dir: wd,
-        pgsc_calc_dir: PGSC_CALC_DIR.to_string(),
-        globus_path: globus_path.to_str().expect("Globus path").to_string(),
-        globus_parent_path: globus_path.parent().expect("Globus parent").to_str().expect("Globus parent path").to_string()
+        pgsc_calc_dir: PGSC_CALC_DIR,
+        globus_path: globus_path.to_str().expect("Globus path"),
+        globus_parent_path: globus_path.parent().expect("Globus parent").to_str().expect("Globus parent path")
     };
     Workflow { content: tt.render("nxf", &context).expect("Rendered nextflow") }
 }
 
 /// Render the callback using TinyTemplate
-fn render_callback(param: &PipelineParam) -> Callback {
-    /// included callback template
-    static CALLBACK: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/callback.txt"));
-    let mut tt = TinyTemplate::new();
-    tt.add_template("callback", CALLBACK).expect("Template");
-    let name: &String = &param.id;
-    let context = CallbackContext { name: name.clone() };
+fn render_callback(tt: &TinyTemplate, param: &PipelineParam) -> Callback {
+    let name: &str = &param.id;
+    let context = CallbackContext { name };
     Callback { content: tt.render("callback", &context).expect("Rendered callback") }
 }
 
 /// Static nextflow configuration for publishing results to Allas
 struct AllasConfig {
-    content: String,
+    content: &'static str,
 }
 
 /// Load static allas configuration
 fn allas_config() -> AllasConfig {
     /// included allas configuration (static)
     static ALLAS: &str = include_str!(concat!(env!("CARGO_MANIFEST_DIR"), "/data/templates/allas.config"));
-    AllasConfig { content: ALLAS.to_string() }
+    AllasConfig { content: ALLAS }
 }
 
 /// Write transfer details to a text file in the working directory
@@ -265,9 +277,10 @@ fn write_transfer(globus: &GlobusDetails, wd: &WorkingDirectory) {
     let out_path = wd.path.join("transfer.txt");
     info!("Writing transfer requests to {}", out_path.display());
 
-    let mut file = File::create(out_path).expect("Transfer file");
+    let mut writer = BufWriter::new(File::create(out_path).expect("Transfer file"));
+    let dir_path = &globus.dir_path_on_guest_collection;
     for data in &globus.files {
-        let line = format!("{}/{} {}\n", globus.dir_path_on_guest_collection, data.filename, data.file_size);
-        file.write_all(&line.as_bytes()).expect("Line written");
+        writeln!(writer, "{}/{} {}", dir_path, data.filename, data.file_size).expect("Line written");
     }
+    writer.flush().expect("Transfer file written");
 }
\ No newline at end of file